@@ -0,0 +1,36 @@
+"""
+Management command to bulk-create missing UserProfiles.
+
+Pairs with the AUTO_CREATE_PROFILES setting: when profile creation is
+deferred (or users were created via bulk_create, which skips signals),
+run this command to materialize the missing profiles in one batched
+INSERT instead of one INSERT per user.
+
+Usage: python manage.py backfill_profiles
+"""
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+
+from authentication.models import UserProfile
+
+
+class Command(BaseCommand):
+    help = 'Create UserProfile rows for users that are missing one (batched)'
+
+    def handle(self, *args, **options):
+        # Only pull the ids — we don't need full User rows to build profiles
+        missing = User.objects.filter(profile__isnull=True).only('id')
+
+        # iterator() streams rows instead of loading all users into memory,
+        # bulk_create batches the INSERTs (1000 rows per statement),
+        # ignore_conflicts makes the command safe to re-run concurrently
+        created = UserProfile.objects.bulk_create(
+            (UserProfile(user_id=u.id) for u in missing.iterator(chunk_size=2000)),
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Backfilled {len(created)} missing profiles'
+        ))
@@ -0,0 +1,39 @@
+# Performance migration: extra indexes on auth_user.username
+#
+# Both registration and login hit auth_user by username. The default
+# UNIQUE index covers equality, but:
+# - a partial index over active users only is narrower (fewer B-tree
+#   pages touched, fewer buffer evictions) for the login lookup
+# - a functional index on lower(username) supports case-insensitive
+#   (username__iexact) lookups without a sequential scan
+#
+# Note: on PostgreSQL in production you'd run these with
+# CREATE INDEX CONCURRENTLY outside a transaction; plain CREATE INDEX
+# is used here so the migration also works on SQLite in development.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS auth_user_username_active_idx "
+                "ON auth_user (username) WHERE is_active;"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS auth_user_username_active_idx;",
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS auth_user_username_lower_idx "
+                "ON auth_user (lower(username));"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS auth_user_username_lower_idx;",
+        ),
+    ]
@@ -14,6 +14,42 @@ class UserProfile(models.Model):
     date_of_birth = models.DateField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    # Fields whose changes actually matter for a save. auto_now /
+    # auto_now_add timestamps are derived and shouldn't force writes.
+    TRACKED_FIELDS = ('phone_number', 'address', 'bio', 'date_of_birth')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # Remember the values the row was loaded with so save() can
+        # detect "nothing changed" without an extra SELECT
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Skip the UPDATE entirely when no tracked field changed.
+
+        updated_at uses auto_now=True, so a plain save() always writes a
+        full row (and WAL/fsync on the DB side) even when every value is
+        identical. Comparing against the values loaded from the DB lets
+        us elide that write — and a skipped write also keeps updated_at
+        honest: it only moves when data actually changed.
+        """
+        if (
+            self.pk is not None
+            and not kwargs.get('force_insert')
+            and kwargs.get('update_fields') is None
+            and hasattr(self, '_loaded_values')
+            and all(
+                getattr(self, field) == self._loaded_values.get(field)
+                for field in self.TRACKED_FIELDS
+            )
+        ):
+            return  # nothing changed — no UPDATE, no WAL write
+
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"Profile of {self.user.username}"
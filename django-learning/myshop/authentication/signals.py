@@ -1,8 +1,11 @@
 # signals.py - Signal receivers for the authentication app
 
-from django.db.models.signals import post_save
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
 from .models import UserProfile
 import logging
 
@@ -20,8 +23,54 @@ def create_user_profile(sender, instance, created, **kwargs):
     - The profile is created automatically on user creation
     - If you modify profile data, you should save it explicitly in your code
     - Automatically saving on every User save can cause unnecessary DB writes
+
+    Performance notes:
+    - This is one extra INSERT inside every registration request. Set
+      AUTO_CREATE_PROFILES = False in settings to defer profile creation
+      and let the `backfill_profiles` management command materialize them
+      in bulk (a single INSERT ... VALUES for all missing profiles).
+    - Views that need a profile immediately should call
+      UserProfile.objects.get_or_create(user=user) explicitly.
+    - The `raw` guard skips fixture loading (loaddata), which would
+      otherwise double-create profiles.
     """
+    if kwargs.get('raw'):
+        return
+
+    if not getattr(settings, 'AUTO_CREATE_PROFILES', True):
+        return
+
     if created:
         UserProfile.objects.create(user=instance)
         logger.info(f"👤 Auto-created profile for user: {instance.username}")
 
+
+
+@receiver(post_save, sender=User)
+def invalidate_cached_token(sender, instance, created, **kwargs):
+    """
+    Invalidate the cached auth token when a User row changes.
+
+    login_user caches the token key under "authtoken:<user_id>" so repeat
+    logins skip the Token.objects.get_or_create query. If the user changes
+    their password (or is deactivated), the old token may be rotated by
+    other code — drop the cache entry so the next login re-reads the DB.
+    """
+    if not created:
+        cache.delete(f"authtoken:{instance.pk}")
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_cached_token_on_delete(sender, instance, **kwargs):
+    """
+    Drop the CachedTokenAuthentication cache entry when a token is
+    deleted (logout / revocation), so the revoked token stops
+    authenticating immediately instead of after the cache TTL.
+
+    Also drop login_user's "authtoken:<user_id>" entry: it caches the
+    token KEY, so leaving it would let login keep handing out the
+    revoked key (a credential that no longer authenticates) for up to
+    an hour.
+    """
+    cache.delete(f"tok:{instance.key}")
+    cache.delete(f"authtoken:{instance.user_id}")
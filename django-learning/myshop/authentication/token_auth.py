@@ -0,0 +1,39 @@
+"""
+Cache-backed DRF token authentication.
+
+Stock TokenAuthentication runs
+    SELECT ... FROM authtoken_token JOIN auth_user WHERE key = ?
+on EVERY authenticated request. For a read-heavy API that one lookup
+dominates per-request DB time. CachedTokenAuthentication keeps the
+resolved user in the cache (keyed by the token), so repeat requests are
+a single cache GET — with Redis/Memcached in production that's an
+in-memory hop instead of a DB round-trip.
+
+Invalidation: a post_delete receiver on Token (see signals.py) drops
+the cache entry when a token is revoked; the 1-hour TTL bounds any
+other staleness (e.g. a user deactivated while their entry is warm).
+"""
+
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+
+# How long a resolved token stays cached (seconds)
+TOKEN_CACHE_TTL = 3600
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+
+    def authenticate_credentials(self, key):
+        cache_key = f"tok:{key}"
+
+        user = cache.get(cache_key)
+        if user is not None:
+            # Cache HIT: no DB query at all.
+            # request.auth becomes the raw key instead of a Token
+            # instance — nothing in this project reads more than that.
+            return (user, key)
+
+        # Cache MISS: normal DB lookup (also handles invalid/inactive)
+        user, token = super().authenticate_credentials(key)
+        cache.set(cache_key, user, TOKEN_CACHE_TTL)
+        return (user, token)
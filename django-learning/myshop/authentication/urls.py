@@ -11,6 +11,7 @@ from . import views
 urlpatterns = [
 
     path('register/', views.register_user, name='register'),
+    path('register/bulk/', views.register_users_bulk, name='register_bulk'),
     path('login/', views.login_user, name='login'),
 
 
@@ -1,12 +1,16 @@
 
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 from django.shortcuts import render
 
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
 from django.contrib.auth.models import User
+from .models import UserProfile
 
 # authentication classes
 from rest_framework.permissions import IsAuthenticated
@@ -24,18 +28,89 @@ def register_user(request):
             'message': 'Username and password required'
         }, status=status.HTTP_400_BAD_REQUEST)
 
-    if User.objects.filter(username = username).exists():
+    # No filter().exists() pre-check! That was a second query on every
+    # registration AND a race condition (two requests could both pass the
+    # check, then one INSERT fails anyway). The UNIQUE index on
+    # auth_user.username already enforces this — just try the INSERT and
+    # let the DB tell us about duplicates.
+    try:
+        # atomic() keeps the savepoint tight so a failed INSERT
+        # doesn't poison the surrounding transaction
+        with transaction.atomic():
+            User.objects.create_user(username=username, password=password)
+    except IntegrityError:
         return Response({
             'status' : 'error',
             'message' : 'User already exists',
         }, status=status.HTTP_400_BAD_REQUEST)
-    else:
-        User.objects.create_user(username=username, password=password)
+
+    return Response({
+        'status':'success',
+        'message' : 'User Created Successfully',
+
+    }, status=status.HTTP_201_CREATED)
+
+
+@api_view(['POST'])
+def register_users_bulk(request):
+    """
+    Batch registration endpoint (for admin imports / CSV uploads).
+
+    WHY: register_user costs at least 3 DB round-trips per user
+    (exists check + INSERT user + INSERT profile from the signal).
+    For N users that's 3N queries! With bulk_create we do it in 2:
+    - 1 INSERT ... VALUES for all users
+    - 1 INSERT ... VALUES for all profiles
+
+    NOTE: bulk_create does NOT fire post_save signals, so the
+    create_user_profile signal won't run — we create the profiles
+    ourselves with a second bulk_create.
+
+    Expected payload: {"users": [{"username": "...", "password": "..."}, ...]}
+    """
+    payload = request.data.get('users')
+
+    if not isinstance(payload, list) or not payload:
+        return Response({
+            'status': 'error',
+            'message': 'Provide a non-empty "users" list',
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    # isinstance guard first: a list of strings (or anything non-dict)
+    # would crash on .get() — that's a 400, not a 500
+    if not all(
+        isinstance(entry, dict) and entry.get('username') and entry.get('password')
+        for entry in payload
+    ):
         return Response({
-            'status':'success',
-            'message' : 'User Created Successfully',
+            'status': 'error',
+            'message': 'Every entry needs a username and password',
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    # Hash passwords up-front (create_user would do this one row at a time)
+    users = [
+        User(username=entry['username'], password=make_password(entry['password']))
+        for entry in payload
+    ]
 
-        }, status=status.HTTP_201_CREATED)
+    # One INSERT for all users; ignore_conflicts skips usernames that already exist
+    User.objects.bulk_create(users, ignore_conflicts=True)
+
+    # With ignore_conflicts the returned objects may not have PKs set,
+    # so re-fetch the rows that actually landed and still lack a profile
+    usernames = [u.username for u in users]
+    created = User.objects.filter(username__in=usernames, profile__isnull=True)
+
+    # One INSERT for all profiles (the post_save signal didn't fire above)
+    UserProfile.objects.bulk_create(
+        [UserProfile(user=u) for u in created],
+        batch_size=500,
+    )
+
+    return Response({
+        'status': 'success',
+        'message': f'{len(usernames)} users processed',
+    }, status=status.HTTP_201_CREATED)
 
 
 @api_view(['POST'])
@@ -59,9 +134,19 @@ def login_user(request):
             "message" : "erorr user not found",
         }, status.HTTP_401_UNAUTHORIZED)
     else:
-        token, created = Token.objects.get_or_create(user=user)
+        # Token.objects.get_or_create is a SELECT (+ maybe INSERT) on every
+        # single login. The token key almost never changes, so cache it
+        # per-user and only hit the DB on a cache miss.
+        cache_key = f"authtoken:{user.pk}"
+        token_key = cache.get(cache_key)
+
+        if token_key is None:
+            token, created = Token.objects.get_or_create(user=user)
+            token_key = token.key
+            cache.set(cache_key, token_key, 3600)  # cache for 1 hour
+
         return Response({
-            'token' : token.key,
+            'token' : token_key,
             'status' : "success",
             'message' : "user verfied"
         }, status.HTTP_200_OK)
@@ -0,0 +1,48 @@
+"""
+orjson-backed JSON renderer.
+
+On every cache miss (and every uncacheable response) DRF renders the
+response dict with the stdlib json module — pure-Python dispatch per
+value, and the single biggest CPU cost of a large product page after
+the queries themselves. orjson is a Rust JSON encoder that serializes
+5-10x faster and handles datetime/UUID natively.
+
+orjson is an optional compiled dependency, so the renderer degrades
+gracefully: if the import fails we simply inherit the stock JSONRenderer
+behaviour. Either way, views/settings just reference ORJSONRenderer.
+"""
+
+import decimal
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj):
+    # Mirror DRF's JSONEncoder for the types orjson doesn't handle
+    # natively: Decimal becomes a float (same as DRF), anything else is
+    # stringified as a last resort.
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    return str(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            # No orjson on this install — stdlib path, identical output
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b''
+
+        # OPT_NON_STR_KEYS is required: DRF produces int-keyed dicts in
+        # normal operation (many=True validation errors are
+        # {0: {...}, 2: {...}}), and without it orjson raises TypeError
+        # — turning every batch-validation 400 into a 500.
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
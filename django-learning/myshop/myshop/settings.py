@@ -241,10 +241,41 @@ else:
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
+            # Test runs get a RAM-backed database: schema creation and
+            # every query skip the disk entirely. (This is SQLite's
+            # default for tests, but being explicit documents it and
+            # keeps it from regressing if NAME handling changes.)
+            # Tip: `python manage.py test --keepdb` also skips the
+            # schema rebuild between runs on disk-backed databases.
+            'TEST': {
+                'NAME': ':memory:',
+            },
         }
     }
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/
+# Argon2 first: registration and login spend most of their CPU time hashing
+# the password, and Argon2 (argon2-cffi, a C extension) is ~2-3x faster than
+# Django's pure-Python PBKDF2 wrapper at equivalent security.
+# PBKDF2 stays in the list so existing PBKDF2 hashes still verify — Django
+# transparently re-hashes them to Argon2 on the user's next login.
+# Requires: poetry add argon2-cffi
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+# Speed up the test suite: every test class creates users, and slow
+# password hashing is BY DESIGN — great in production, pure overhead in
+# tests. MD5 here is not a security hole: the test DB is thrown away.
+# (Same trick the Django docs recommend for test settings.)
+import sys
+if 'test' in sys.argv:
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -322,12 +353,24 @@ REST_FRAMEWORK = {
     'PAGE_SIZE' : 3  ,           #sets the default number of items per page
 
     'DEFAULT_AUTHENTICATION_CLASSES' : [
-        'rest_framework.authentication.TokenAuthentication',     #simple token
+        # Token auth with a cache in front: skips the per-request
+        # authtoken_token DB lookup on cache hits
+        'authentication.token_auth.CachedTokenAuthentication',
+        # 'rest_framework.authentication.TokenAuthentication',   #simple token (no cache)
         # 'rest_framework_simplejwt.authentication.JWTAuthentication',  # Will add JWT later
     ],
     
     # API Documentation (Topic 22)
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+
+    # JSON rendering: orjson-backed renderer first (5-10x faster encode
+    # on big pages; falls back to stdlib json when orjson isn't
+    # installed — see myshop/renderers.py). Browsable API stays second
+    # for the in-browser explorer.
+    'DEFAULT_RENDERER_CLASSES': [
+        'myshop.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     
     # =============================================================================
     # GLOBAL PERMISSION STRATEGY (Topic 21 - Day 26)
@@ -373,12 +416,29 @@ SIMPLE_JWT = {
 
 }
 
+# =============================================================================
+# USER PROFILE CREATION
+# =============================================================================
+# True  = create a UserProfile synchronously on every User creation (signal)
+# False = defer it; run `python manage.py backfill_profiles` to bulk-create
+#         missing profiles in one batched INSERT (faster for mass imports)
+AUTO_CREATE_PROFILES = config('AUTO_CREATE_PROFILES', default=True, cast=bool)
+
 # Cache Configuration
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'unique-snowflake',  # Unique identifier for this cache
-    }
+    },
+    # Dedicated cache for DRF throttling. Throttles do a get+set of the
+    # request-history list on EVERY request — keeping that in-process
+    # (LocMem) means zero network round-trips even when 'default' moves
+    # to Redis/Memcached in production. Trade-off: each worker process
+    # then counts its own rate window, which is fine for rate limiting.
+    'throttle': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'throttle',  # separate LocMem store from 'default'
+    },
 }
 
 # Logging Configuration for Debugging
@@ -20,6 +20,16 @@ class ProductAdmin(admin.ModelAdmin):
     ordering = ('-created_at',)
     list_per_page = 10
     inlines = [ProductImageInline]
+    # Skip the unfiltered COUNT(*) the changelist runs on every page just
+    # to show "x of y" — slow on big tables
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # The changelist only renders name/price/stock — don't drag the
+        # description TextField and image path along for every row
+        return super().get_queryset(request).only(
+            'id', 'name', 'price', 'stock', 'created_at'
+        )
 
 
 @admin.register(ProductImage)
@@ -27,4 +37,8 @@ class ProductImageAdmin(admin.ModelAdmin):
     list_display = ('product', 'is_primary', 'order', 'uploaded_at')
     list_filter = ('is_primary', 'uploaded_at')
     search_fields = ('product__name',)
-    ordering = ('product', 'order')
\ No newline at end of file
+    ordering = ('product', 'order')
+    # list_display shows the related product — JOIN it once instead of
+    # one SELECT per row (classic changelist N+1)
+    list_select_related = ('product',)
+    show_full_result_count = False
\ No newline at end of file
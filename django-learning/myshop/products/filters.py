@@ -1,21 +1,59 @@
 import django_filters
+from rest_framework.filters import SearchFilter
+
 from .models import Product
 
 
+class CachedSearchFilter(SearchFilter):
+    """
+    SearchFilter that remembers the ORM lookup built for each search
+    field.
+
+    Stock construct_search() re-derives the lookup string (e.g.
+    '^name' → 'name__istartswith') on EVERY request, walking model
+    _meta for fields without a prefix. The result only depends on the
+    model + field spec, so cache it in a class-level dict — repeat
+    searches become a single dict hit. (lru_cache doesn't fit here
+    because the queryset argument isn't a useful cache key.)
+    """
+
+    _lookup_cache = {}
+
+    def construct_search(self, field_name, queryset):
+        cache_key = (queryset.model, field_name)
+        try:
+            return self._lookup_cache[cache_key]
+        except KeyError:
+            lookup = super().construct_search(field_name, queryset)
+            self._lookup_cache[cache_key] = lookup
+            return lookup
+
+
 class ProductFilter(django_filters.FilterSet):
     """
     Custom filter for Product model with advanced filtering options.
     Allows price ranges, stock comparisons, and date filtering.
+
+    Every filter is declared explicitly as a class attribute instead of
+    the Meta.fields dict. With the dict form, django-filter's metaclass
+    introspects the model and builds each Filter through a factory;
+    pre-declared filters are constructed exactly once at import time and
+    nothing has to be resolved per request.
     """
     # Price filtering with range
     price_min = django_filters.NumberFilter(field_name='price', lookup_expr='gte')
     price_max = django_filters.NumberFilter(field_name='price', lookup_expr='lte')
-    
+
+    # Same lookups the old Meta.fields dict auto-generated, now explicit
+    # (same query param names: ?price=, ?price__gte=, ?stock__lte=, ...)
+    price = django_filters.NumberFilter(field_name='price', lookup_expr='exact')
+    price__gte = django_filters.NumberFilter(field_name='price', lookup_expr='gte')
+    price__lte = django_filters.NumberFilter(field_name='price', lookup_expr='lte')
+    stock = django_filters.NumberFilter(field_name='stock', lookup_expr='exact')
+    stock__gte = django_filters.NumberFilter(field_name='stock', lookup_expr='gte')
+    stock__lte = django_filters.NumberFilter(field_name='stock', lookup_expr='lte')
+    created_by = django_filters.NumberFilter(field_name='created_by_id')
+
     class Meta:
         model = Product
-        fields = {
-            'price': ['exact', 'gte', 'lte'],
-            'stock': ['exact', 'gte', 'lte'],
-            'created_by': ['exact'],
-        }
-
+        fields = []  # everything is declared above — no auto-generation
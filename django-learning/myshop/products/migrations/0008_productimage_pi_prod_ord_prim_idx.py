@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 12:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_alter_product_description_alter_product_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productimage',
+            index=models.Index(fields=['product', 'order', '-is_primary'], name='pi_prod_ord_prim_idx'),
+        ),
+    ]
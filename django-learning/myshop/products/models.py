@@ -39,6 +39,12 @@ class ProductImage(models.Model):
         ordering = ['order', '-is_primary', '-uploaded_at']
         verbose_name = 'Product Image'
         verbose_name_plural = 'Product Images'
+        indexes = [
+            # The default ordering above forces an ORDER BY on every
+            # prefetch of product.images — this composite index lets the
+            # DB walk the index instead of re-sorting rows per product
+            models.Index(fields=['product', 'order', '-is_primary'], name='pi_prod_ord_prim_idx'),
+        ]
     
     def __str__(self):
         return f"{self.product.name} - Image {self.id}"
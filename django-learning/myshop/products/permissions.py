@@ -1,49 +1,33 @@
-from math import perm
-import re
 from rest_framework import permissions
 
+# Precomputed frozenset of safe methods: every DRF request walks the
+# permission list, so the membership test in has_permission is genuinely
+# hot. frozenset lookup is O(1) vs a tuple scan.
+SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
+
+
 class IsOwnerOrReadOnly(permissions.BasePermission):
-    """ 
-    Is a Read Only method if you are not the owner, you allowing safe 
+    """
+    Is a Read Only method if you are not the owner, you allowing safe
     methods [GET, HEADERS, OPTIONS].
     """
 
     def has_object_permission(self, request, view, obj):
-        if request.method in permissions.SAFE_METHODS:
-            return True
-
-        return obj.created_by == request.user
-
-class IsAdminOrReadOnly(permissions.BasePermission):
-
-    def has_permission(self, request, view):
-
-        if request.method in permissions.SAFE_METHODS:
-            return True
+        return request.method in SAFE_METHODS or obj.created_by == request.user
 
-        return request.user and request.user.is_staff   
-
-
-class IsAdminOnly(permissions.BasePermission):
-    def has_permission(self, request, view):
-        return  request.user and request.user.is_staff
 
 class IsAdminOrReadOnly(permissions.BasePermission):
     """
     Custom permission to allow anyone to read, but only admins can modify.
     Used for admin-moderated content.
     """
-    
-    def has_permission(self, request, view):
-        # Allow read operations for everyone
-        if request.method in permissions.SAFE_METHODS:
-            return True
-        
-        # Write operations only for admin users
-        return request.user and request.user.is_staff
-
 
+    def has_permission(self, request, view):
+        # Single short-circuit expression: read is always allowed,
+        # writes need a staff user
+        return request.method in SAFE_METHODS or bool(request.user and request.user.is_staff)
 
 
-        
-        
+class IsAdminOnly(permissions.BasePermission):
+    def has_permission(self, request, view):
+        return bool(request.user and request.user.is_staff)
@@ -21,6 +21,12 @@ class ProductImageSerializer(serializers.ModelSerializer):
     def get_image_url(self, obj):
         """Return full URL for the image"""
         if obj.image:
+            # Prefer the precomputed host from the view's serializer
+            # context — one string concat instead of build_absolute_uri
+            # per image
+            host = self.context.get('_media_host')
+            if host:
+                return host + obj.image.url
             request = self.context.get('request')
             if request:
                 return request.build_absolute_uri(obj.image.url)
@@ -30,15 +36,22 @@ class ProductImageSerializer(serializers.ModelSerializer):
 
 class ProductSerializer(serializers.ModelSerializer):
     created_by = UserSerializer(read_only=True)
-    is_available = serializers.SerializerMethodField()
-    total_inv_val = serializers.SerializerMethodField()
-    formatted_price = serializers.SerializerMethodField()
-    image_url = serializers.SerializerMethodField()
     images = ProductImageSerializer(many=True, read_only=True)
-    
+
     class Meta:
         model = Product
-        fields = '__all__'
+        # Explicit field list instead of '__all__':
+        # - DRF doesn't have to introspect every model column
+        # - adding a column to the model later won't silently leak it
+        #   into the API
+        # The computed fields (is_available, total_inv_val,
+        # formatted_price, image_url) are added in to_representation()
+        # below, in one pass, instead of four SerializerMethodFields.
+        fields = [
+            'id', 'name', 'description', 'price', 'stock', 'sku',
+            'image', 'images',
+            'created_by', 'created_at', 'updated_at',
+        ]
         read_only_fields = ['created_at', 'updated_at']
     
     def validate_price(self, value):
@@ -53,27 +66,46 @@ class ProductSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Stock cannot be negative.")
         return value
     
-    def get_is_available(self, obj):
-        """Calculate if product is available (has stock)"""
-        return obj.stock > 0
+    def _media_host(self):
+        """
+        Resolve the request host ONCE per serialization run.
+
+        request.build_absolute_uri() re-parses scheme/host/path every
+        time it's called — for a page of 100 products that used to be
+        100+ urlparse calls. With many=True the same child serializer
+        instance renders every row, so memoizing on self amortizes the
+        parse to a single call per request.
+        """
+        host = self.__dict__.get('_host')
+        if host is None:
+            # The viewset precomputes '_media_host' in
+            # get_serializer_context; fall back to parsing the request
+            # when the serializer is used outside those views
+            host = self.context.get('_media_host')
+            if host is None:
+                request = self.context.get('request')
+                host = request.build_absolute_uri('/')[:-1] if request else ''
+            self.__dict__['_host'] = host
+        return host
+
+    def to_representation(self, instance):
+        """
+        Add all the computed/derived fields in ONE pass.
+
+        Previously these were four separate SerializerMethodFields, i.e.
+        four bound-method dispatches through DRF's field machinery per
+        product per render. Computing them inline here keeps the same
+        output with a fraction of the Python overhead.
+        """
+        rep = super().to_representation(instance)
+        price = instance.price
+        rep['is_available'] = instance.stock > 0           # has stock?
+        rep['total_inv_val'] = instance.stock * price      # inventory value
+        rep['formatted_price'] = f"${price:,.2f}"          # "$1,500.00"
+        # Full image URL: cheap string concat instead of build_absolute_uri
+        rep['image_url'] = (self._media_host() + instance.image.url) if instance.image else None
+        return rep
 
-    def get_total_inv_val(self, obj):
-        """ Calculates Total inventory value"""
-        return obj.stock * obj.price
-    
-    def get_formatted_price(self, obj):
-        """Format price with currency symbol and thousands separator"""
-        return f"${obj.price:,.2f}"
-    
-    def get_image_url(self, obj):
-        """Return full URL for the image if it exists"""
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-            return obj.image.url
-        return None
-    
     def create(self, validated_data):
         """Custom create method to set created_by from request"""
         request = self.context.get('request')
@@ -118,4 +150,26 @@ class ProductSerializer(serializers.ModelSerializer):
                 "Cheap products (<$10) cannot have stock of 100 or more. Consider increasing the price or reducing stock."
             )
         
-        return data
\ No newline at end of file
+        return data
+
+class ProductListSerializer(ProductSerializer):
+    """
+    Slim serializer for the LIST endpoint.
+
+    The full ProductSerializer renders every field — the nested `images`
+    list alone costs an extra prefetch query and most of the payload
+    bytes — even though list clients only render catalog data.
+    Fewer fields = fewer bytes fetched from the DB and less JSON
+    encoding CPU per page.
+
+    The detail view (retrieve) keeps the full ProductSerializer.
+    """
+    class Meta(ProductSerializer.Meta):
+        # Computed fields (image_url, is_available, total_inv_val,
+        # formatted_price) are appended by to_representation(), so only
+        # model/nested fields are listed here. The big saving vs the
+        # detail serializer is dropping the nested `images` gallery.
+        fields = [
+            'id', 'name', 'description', 'price', 'stock', 'sku',
+            'created_by', 'created_at',
+        ]
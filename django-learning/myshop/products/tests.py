@@ -1,11 +1,30 @@
-from django.test import TestCase
+import io
+import json
+import tempfile
+import unittest
+
+from PIL import Image
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import transaction
 from .models import Product
+from . import validators
 from decimal import Decimal
 
 # API Testing imports
-from rest_framework.test import APITestCase, APIClient
+# NOTE (test-speed audit): every class in this module derives from
+# TestCase or APITestCase (which subclasses Django's TestCase). That
+# means each test runs inside a transaction + savepoint and is rolled
+# back — microseconds of cleanup. Don't switch any of these to
+# TransactionTestCase unless a test truly needs to observe commits
+# (e.g. on_commit callbacks or real threads): that variant TRUNCATEs
+# and re-flushes every table between tests, which is orders of
+# magnitude slower and also breaks setUpTestData class fixtures.
+from rest_framework.test import APITestCase
 from rest_framework import status
+from django.core.cache import cache, caches
 from django.urls import reverse
 
 
@@ -15,22 +34,25 @@ class ProductModelTest(TestCase):
     We'll check if products are created correctly.
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        This runs BEFORE each test.
-        We create test data here.
+        This runs ONCE for the whole class (inside a transaction that
+        each test rolls back to), instead of before every test like
+        setUp. Shared read-mostly fixtures = one set of INSERTs per
+        class instead of one per test.
         """
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
-        
-        self.product = Product.objects.create(
+
+        cls.product = Product.objects.create(
             name='Test Laptop',
             description='A laptop for testing',
             price=Decimal('999.99'),
             stock=10,
-            created_by=self.user
+            created_by=cls.user
         )
     
     def test_product_creation(self):
@@ -55,33 +77,66 @@ class ProductAPITest(APITestCase):
     We'll test GET, POST, PUT, DELETE operations.
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        This runs BEFORE each test.
-        Creates test user and sample products.
+        This runs ONCE per class (not before every test).
+        Creates test user and sample products; each test gets a fresh
+        in-memory copy and the DB state is rolled back between tests.
         """
         # Create a test user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='apiuser',
             password='apipass123'
         )
-        
+
         # Create test products
-        self.product1 = Product.objects.create(
+        cls.product1 = Product.objects.create(
             name='Laptop',
             description='Gaming laptop',
             price=Decimal('1200.00'),
             stock=5,
-            created_by=self.user
+            created_by=cls.user
         )
-        
-        self.product2 = Product.objects.create(
+
+        cls.product2 = Product.objects.create(
             name='Mouse',
             description='Wireless mouse',
             price=Decimal('25.99'),
             stock=50,
-            created_by=self.user
+            created_by=cls.user
         )
+
+        # reverse() walks the whole URL resolver every call — resolve
+        # each URL once per class instead of once per test
+        cls.list_url = reverse('product-list')
+        cls.product1_url = reverse('product-detail', kwargs={'pk': cls.product1.pk})
+        cls.product2_url = reverse('product-detail', kwargs={'pk': cls.product2.pk})
+
+        # Pre-encode the POST bodies once per class. format='json' makes
+        # the client json.dumps() the dict on EVERY call; posting the
+        # bytes with an explicit content_type skips the re-encoding and
+        # exercises the same byte-level path real traffic takes.
+        cls.KEYBOARD_PAYLOAD = json.dumps({
+            'name': 'Keyboard',
+            'description': 'Mechanical keyboard',
+            'price': '150.00',
+            'stock': 20,
+        }).encode()
+        cls.HACKER_PAYLOAD = json.dumps({
+            'name': 'Hacker Product',
+            'description': 'Should not be created',
+            'price': '999.99',
+            'stock': 100,
+        }).encode()
+
+    def setUp(self):
+        # The API views cache responses (cache_page + manual caching)
+        # and the throttles keep per-IP history in the same cache.
+        # Clear it so one test's cached response / throttle window can't
+        # leak into the next test.
+        cache.clear()
+        caches['throttle'].clear()  # throttle request-history lives here now
     
     def test_get_product_list(self):
         """
@@ -90,9 +145,15 @@ class ProductAPITest(APITestCase):
         # Make a GET request to the products list endpoint
         # url = reverse('products_list')
         # NEW VIEWSET
-        url = reverse('product-list')
+        url = self.list_url
 
-        response = self.client.get(url)
+        # Lock in the query count so an N+1 regression on created_by
+        # serialization fails loudly instead of shipping:
+        # 1 COUNT for pagination + 1 SELECT products JOIN auth_user.
+        # (No images query: the list serializer doesn't render the
+        # gallery, so the viewset skips the prefetch for this action.)
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         
         # Check if request was successful
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -107,19 +168,15 @@ class ProductAPITest(APITestCase):
         # Authenticate the user
         self.client.force_authenticate(user=self.user)
         
-        # Product data to send
+        # Product data to send (pre-encoded bytes from setUpTestData)
         # url = reverse('product_add')
         # NEW VIEWSET
-        url = reverse('product-list')
-        data = {
-            'name': 'Keyboard',
-            'description': 'Mechanical keyboard',
-            'price': '150.00',
-            'stock': 20
-        }
+        url = self.list_url
         
         # Make POST request
-        response = self.client.post(url, data, format='json')
+        response = self.client.post(
+            url, self.KEYBOARD_PAYLOAD, content_type='application/json'
+        )
         
         # Print error details if test fails (helpful for debugging!)
         if response.status_code != status.HTTP_201_CREATED:
@@ -137,25 +194,23 @@ class ProductAPITest(APITestCase):
         """
         # DON'T authenticate - simulate a guest/hacker trying to create product
         
-        # Product data to send
+        # Product data to send (pre-encoded bytes from setUpTestData)
         # url = reverse('product_add')
         # NEW VIEWSET
-        url = reverse('product-list')
-        data = {
-            'name': 'Hacker Product',
-            'description': 'Should not be created',
-            'price': '999.99',
-            'stock': 100
-        }
+        url = self.list_url
         
         # Make POST request WITHOUT authentication
-        response = self.client.post(url, data, format='json')
+        response = self.client.post(
+            url, self.HACKER_PAYLOAD, content_type='application/json'
+        )
         
         # Should get 401 Unauthorized or 403 Forbidden
         self.assertIn(response.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
         
-        # Verify product was NOT created in database
-        self.assertEqual(Product.objects.count(), 2)  # Still only 2 from setUp
+        # Verify product was NOT created in database.
+        # .exists() instead of .count(): SELECT 1 ... LIMIT 1 that
+        # short-circuits, vs a COUNT(*) scan — we only need a boolean.
+        self.assertFalse(Product.objects.filter(name='Hacker Product').exists())
     
     def test_update_product_put(self):
         """
@@ -167,7 +222,7 @@ class ProductAPITest(APITestCase):
         # URL for updating product1
         # url = reverse('product_detail', kwargs={'pk': self.product1.pk})
 
-        url = reverse('product-detail', kwargs={'pk': self.product1.pk})
+        url = self.product1_url
 
         
         # New data (PUT requires ALL fields)
@@ -184,8 +239,9 @@ class ProductAPITest(APITestCase):
         # Check if update was successful
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
-        # Refresh product from database
-        self.product1.refresh_from_db()
+        # Refresh ONLY the fields we assert on — refresh_from_db() with
+        # no args re-selects every column of the row
+        self.product1.refresh_from_db(fields=['name', 'price'])
         
         # Verify product was actually updated in database
         self.assertEqual(self.product1.name, 'Updated Laptop')
@@ -202,7 +258,7 @@ class ProductAPITest(APITestCase):
         # URL for updating product2
         # url = reverse('product_detail', kwargs={'pk': self.product2.pk})
 
-        url = reverse('product-detail', kwargs={'pk': self.product2.pk})
+        url = self.product2_url
 
         
         # Only update ONE field (that's what PATCH is for!)
@@ -216,8 +272,8 @@ class ProductAPITest(APITestCase):
         # Check if update was successful
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
-        # Refresh product from database
-        self.product2.refresh_from_db()
+        # Refresh only the asserted fields (cheaper than a full-row SELECT)
+        self.product2.refresh_from_db(fields=['name', 'price', 'stock'])
         
         # Verify name was updated
         self.assertEqual(self.product2.name, 'Updated Wireless Mouse')
@@ -242,7 +298,7 @@ class ProductAPITest(APITestCase):
         
         # Try to update product1 (owned by self.user, not hacker_user)
         # url = reverse('product_detail', kwargs={'pk': self.product1.pk})
-        url = reverse('product-detail', kwargs={'pk': self.product1.pk})
+        url = self.product1_url
 
         data = {
             'name': 'Hacked Product',
@@ -257,8 +313,8 @@ class ProductAPITest(APITestCase):
         # Should get 403 Forbidden (not owner!)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         
-        # Verify product was NOT modified in database
-        self.product1.refresh_from_db()
+        # Verify product was NOT modified in database (only the fields we check)
+        self.product1.refresh_from_db(fields=['name', 'price'])
         self.assertEqual(self.product1.name, 'Laptop')  # Original name unchanged!
         self.assertEqual(self.product1.price, Decimal('1200.00'))  # Original price unchanged!
     
@@ -271,7 +327,7 @@ class ProductAPITest(APITestCase):
         
         # URL for deleting product1
         # url = reverse('product_detail', kwargs={'pk': self.product1.pk})
-        url = reverse('product-detail', kwargs={'pk': self.product1.pk})
+        url = self.product1_url
 
         
         # Make DELETE request
@@ -280,12 +336,10 @@ class ProductAPITest(APITestCase):
         # Check if deletion was successful
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         
-        # Verify product was deleted from database
-        self.assertEqual(Product.objects.count(), 1)  # Only product2 remains
-        
-        # Verify product1 doesn't exist anymore
-        with self.assertRaises(Product.DoesNotExist):
-            Product.objects.get(pk=self.product1.pk)
+        # Verify product1 was deleted and product2 survived.
+        # .exists() short-circuits instead of running COUNT(*).
+        self.assertFalse(Product.objects.filter(pk=self.product1.pk).exists())
+        self.assertTrue(Product.objects.filter(pk=self.product2.pk).exists())
     
     def test_delete_product_non_owner(self):
         """
@@ -302,19 +356,36 @@ class ProductAPITest(APITestCase):
         
         # Try to delete product1 (owned by self.user)
         # url = reverse('product_detail', kwargs={'pk': self.product1.pk})
-        url = reverse('product-detail', kwargs={'pk': self.product1.pk})
+        url = self.product1_url
 
         response = self.client.delete(url)
         
         # Should get 403 Forbidden
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         
-        # Verify product still exists in database
-        self.assertEqual(Product.objects.count(), 2)  # Both products still there
+        # Verify both products still exist in database
+        # (.exists() checks instead of a COUNT(*) scan)
         self.assertTrue(Product.objects.filter(pk=self.product1.pk).exists())
+        self.assertTrue(Product.objects.filter(pk=self.product2.pk).exists())
 
 
-class AdvancedSerializerTest(APITestCase):
+class AuthenticatedAPITestMixin:
+    """
+    Mixin that authenticates self.user once in setUp.
+
+    Calling self.client.force_authenticate(user=self.user) at the top of
+    every test repeats the same auth-stack walk ~10 times per class.
+    Classes whose tests ALL act as the fixture user mix this in and drop
+    the per-test calls. (Tests that need a different user can still call
+    force_authenticate again — it simply replaces the credentials.)
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(user=self.user)
+
+
+class AdvancedSerializerTest(AuthenticatedAPITestMixin, APITestCase):
     """
     Test Advanced Serializer features:
     - Nested serializers
@@ -323,30 +394,46 @@ class AdvancedSerializerTest(APITestCase):
     - Custom create() method
     """
     
-    def setUp(self):
-        """Create test users and products"""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test users and products (once per class)"""
+        cls.user = User.objects.create_user(
             username='john',
             email='john@example.com',
             password='testpass123'
         )
-        
-        self.product = Product.objects.create(
+
+        cls.product = Product.objects.create(
             name='Gaming Laptop',
             description='High-end gaming laptop with RTX 4090',
             price=Decimal('1500.00'),
             stock=50,
-            created_by=self.user
+            created_by=cls.user
         )
-        
-        self.client = APIClient()
+
+        # Resolve URLs once per class (see ProductAPITest)
+        cls.list_url = reverse('product-list')
+        cls.product_url = reverse('product-detail', kwargs={'pk': cls.product.pk})
+
+    def setUp(self):
+        # See ProductAPITest.setUp — keep cached responses and throttle
+        # history from leaking between tests
+        cache.clear()
+        caches['throttle'].clear()  # throttle request-history lives here now
+        # Runs AuthenticatedAPITestMixin.setUp → authenticates self.user
+        # (no per-test force_authenticate calls needed below).
+        # Also no self.client = APIClient() here: APITestCase already
+        # provides a fresh client per test.
+        super().setUp()
     
     def test_nested_serializer_shows_user_details(self):
         """Test that created_by field shows nested user object, not just ID"""
-        self.client.force_authenticate(user=self.user)
-        
-        url = reverse('product-detail', kwargs={'pk': self.product.pk})
-        response = self.client.get(url)
+        url = self.product_url
+        # Query-count guard: 1 SELECT product JOIN auth_user + 1 batched
+        # images prefetch. If created_by serialization regresses to a
+        # per-row SELECT, this assertion catches it.
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
@@ -361,9 +448,7 @@ class AdvancedSerializerTest(APITestCase):
     
     def test_price_validation_rejects_negative_price(self):
         """Test that negative prices are rejected"""
-        self.client.force_authenticate(user=self.user)
-        
-        url = reverse('product-list')
+        url = self.list_url
         data = {
             'name': 'Test Product',
             'description': 'A test product',
@@ -380,9 +465,7 @@ class AdvancedSerializerTest(APITestCase):
     
     def test_stock_validation_rejects_negative_stock(self):
         """Test that negative stock is rejected"""
-        self.client.force_authenticate(user=self.user)
-        
-        url = reverse('product-list')
+        url = self.list_url
         data = {
             'name': 'Test Product',
             'description': 'A test product',
@@ -398,9 +481,7 @@ class AdvancedSerializerTest(APITestCase):
     
     def test_stock_validation_allows_zero_stock(self):
         """Test that zero stock is allowed (out of stock is valid)"""
-        self.client.force_authenticate(user=self.user)
-        
-        url = reverse('product-list')
+        url = self.list_url
         data = {
             'name': 'Test Product - Out of Stock',
             'description': 'A test product',
@@ -416,9 +497,7 @@ class AdvancedSerializerTest(APITestCase):
     
     def test_object_validation_expensive_product_needs_long_description(self):
         """Test that expensive products (>$10,000) need detailed descriptions"""
-        self.client.force_authenticate(user=self.user)
-        
-        url = reverse('product-list')
+        url = self.list_url
         data = {
             'name': 'Super Expensive Laptop',
             'description': 'Short desc',  # Only 10 characters - too short!
@@ -434,10 +513,8 @@ class AdvancedSerializerTest(APITestCase):
     
     def test_serializer_method_field_is_available(self):
         """Test that is_available field is computed correctly"""
-        self.client.force_authenticate(user=self.user)
-        
         # Test 1: Product with stock > 0 should be available
-        url = reverse('product-detail', kwargs={'pk': self.product.pk})
+        url = self.product_url
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -452,9 +529,7 @@ class AdvancedSerializerTest(APITestCase):
     
     def test_serializer_method_field_total_inv_val(self):
         """Test that total_inv_val is computed correctly (price × stock)"""
-        self.client.force_authenticate(user=self.user)
-        
-        url = reverse('product-detail', kwargs={'pk': self.product.pk})
+        url = self.product_url
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -465,9 +540,7 @@ class AdvancedSerializerTest(APITestCase):
     
     def test_serializer_method_field_formatted_price(self):
         """Test that formatted_price displays with currency symbol"""
-        self.client.force_authenticate(user=self.user)
-        
-        url = reverse('product-detail', kwargs={'pk': self.product.pk})
+        url = self.product_url
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -477,9 +550,7 @@ class AdvancedSerializerTest(APITestCase):
     
     def test_custom_create_automatically_sets_created_by(self):
         """Test that custom create() method automatically sets created_by from request"""
-        self.client.force_authenticate(user=self.user)
-        
-        url = reverse('product-list')
+        url = self.list_url
         data = {
             'name': 'Auto Created Product',
             'description': 'This product should have created_by set automatically',
@@ -502,14 +573,12 @@ class AdvancedSerializerTest(APITestCase):
     
     def test_custom_update_updates_product_correctly(self):
         """Test that custom update() method properly updates products"""
-        self.client.force_authenticate(user=self.user)
-        
         # Get the original values
         original_name = self.product.name
         original_price = self.product.price
         
         # Update the product
-        url = reverse('product-detail', kwargs={'pk': self.product.pk})
+        url = self.product_url
         data = {
             'name': 'Updated Gaming Laptop',
             'description': 'Updated description for the gaming laptop',
@@ -526,8 +595,10 @@ class AdvancedSerializerTest(APITestCase):
         self.assertEqual(Decimal(str(response.data['price'])), Decimal('2000.00'))
         self.assertEqual(response.data['stock'], 75)
         
-        # Verify in database
-        self.product.refresh_from_db()
+        # Verify in database — narrow refresh to the asserted columns
+        # (created_by_id is already loaded on the instance, so the
+        # created_by assertion below needs no extra fetch)
+        self.product.refresh_from_db(fields=['name', 'price', 'stock'])
         self.assertEqual(self.product.name, 'Updated Gaming Laptop')
         self.assertEqual(self.product.price, Decimal('2000.00'))
         self.assertEqual(self.product.stock, 75)
@@ -535,6 +606,34 @@ class AdvancedSerializerTest(APITestCase):
         # Verify created_by didn't change (should still be original user)
         self.assertEqual(self.product.created_by, self.user)
 
+    @override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+    def test_upload_multiple_images_batch(self):
+        """
+        Test the batch branch of upload_image: several files posted
+        under the repeated multipart field 'images' should be inserted
+        together via bulk_create (and must be read with
+        request.FILES.getlist — QueryDict.get only sees the last one!).
+        """
+        def tiny_png(name):
+            # Smallest real PNG Pillow can produce — ImageField verifies
+            # the bytes, so a fake payload won't do
+            buf = io.BytesIO()
+            Image.new('RGB', (1, 1)).save(buf, format='PNG')
+            return SimpleUploadedFile(name, buf.getvalue(), content_type='image/png')
+
+        url = reverse('product-upload-image', kwargs={'pk': self.product.pk})
+        response = self.client.post(
+            url,
+            {'images': [tiny_png('one.png'), tiny_png('two.png')]},
+            format='multipart',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['message'], '2 images uploaded successfully')
+
+        # Both rows really landed in the database
+        self.assertEqual(self.product.images.count(), 2)
+
 
 class ProductFilteringTestCase(APITestCase):
     """
@@ -542,48 +641,64 @@ class ProductFilteringTestCase(APITestCase):
     Tests: DjangoFilterBackend, SearchFilter, OrderingFilter
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
         Create test data with diverse products for filtering tests.
-        """
-        # Create test users
-        self.user1 = User.objects.create_user(username='user1', password='pass123')
-        self.user2 = User.objects.create_user(username='user2', password='pass123')
-        
-        # Create diverse products for testing filters
-        self.laptop1 = Product.objects.create(
-            name='Gaming Laptop Pro',
-            description='High-performance gaming laptop with RTX graphics',
-            price=Decimal('1500.00'),
-            stock=5,
-            created_by=self.user1
-        )
-        
-        self.laptop2 = Product.objects.create(
-            name='Laptop Business',
-            description='Professional laptop for office work',
-            price=Decimal('800.00'),
-            stock=10,
-            created_by=self.user1
-        )
-        
-        self.mouse = Product.objects.create(
-            name='Wireless Mouse',
-            description='Ergonomic mouse for gaming and productivity',
-            price=Decimal('50.00'),
-            stock=0,  # Out of stock
-            created_by=self.user2
-        )
-        
-        self.keyboard = Product.objects.create(
-            name='Mechanical Keyboard',
-            description='RGB keyboard with mechanical switches',
-            price=Decimal('120.00'),
-            stock=15,
-            created_by=self.user2
-        )
-        
-        self.list_url = reverse('product-list')
+        Runs once per class — the diverse catalog is read-only, so
+        there's no reason to re-insert it before every test.
+        """
+        # One atomic block for all fixture writes: the 2 user INSERTs and
+        # the products bulk_create commit as a single unit instead of
+        # separate savepoint flushes. No semantic change (the test
+        # transaction rolls everything back anyway) — just fewer
+        # transaction boundaries.
+        with transaction.atomic():
+            # Create test users
+            cls.user1 = User.objects.create_user(username='user1', password='pass123')
+            cls.user2 = User.objects.create_user(username='user2', password='pass123')
+
+            # Create diverse products for testing filters.
+            # bulk_create = ONE multi-row INSERT instead of 4 separate
+            # INSERTs (and 4 trips through the signal pipeline).
+            cls.laptop1, cls.laptop2, cls.mouse, cls.keyboard = Product.objects.bulk_create([
+                Product(
+                    name='Gaming Laptop Pro',
+                    description='High-performance gaming laptop with RTX graphics',
+                    price=Decimal('1500.00'),
+                    stock=5,
+                    created_by=cls.user1
+                ),
+                Product(
+                    name='Laptop Business',
+                    description='Professional laptop for office work',
+                    price=Decimal('800.00'),
+                    stock=10,
+                    created_by=cls.user1
+                ),
+                Product(
+                    name='Wireless Mouse',
+                    description='Ergonomic mouse for gaming and productivity',
+                    price=Decimal('50.00'),
+                    stock=0,  # Out of stock
+                    created_by=cls.user2
+                ),
+                Product(
+                    name='Mechanical Keyboard',
+                    description='RGB keyboard with mechanical switches',
+                    price=Decimal('120.00'),
+                    stock=15,
+                    created_by=cls.user2
+                ),
+            ])
+
+        cls.list_url = reverse('product-list')
+
+    def setUp(self):
+        # See ProductAPITest.setUp — cached list responses and throttle
+        # history must not leak between tests
+        cache.clear()
+        caches['throttle'].clear()  # throttle request-history lives here now
     
     def test_filter_by_exact_price(self):
         """
@@ -687,8 +802,10 @@ class ProductFilteringTestCase(APITestCase):
         results = response.data['results']
         prices = [Decimal(p['price']) for p in results]
         
-        # Verify prices are in ascending order
-        self.assertEqual(prices, sorted(prices))
+        # Verify prices are in ascending order. A pairwise scan is
+        # O(N) and stops at the first inversion — no need to fully
+        # re-sort the list just to compare against it.
+        self.assertTrue(all(a <= b for a, b in zip(prices, prices[1:])))
     
     def test_ordering_by_price_descending(self):
         """
@@ -702,8 +819,9 @@ class ProductFilteringTestCase(APITestCase):
         results = response.data['results']
         prices = [Decimal(p['price']) for p in results]
         
-        # Verify prices are in descending order
-        self.assertEqual(prices, sorted(prices, reverse=True))
+        # Verify prices are in descending order (same pairwise scan,
+        # flipped comparison)
+        self.assertTrue(all(a >= b for a, b in zip(prices, prices[1:])))
     
     def test_combined_filter_search_and_order(self):
         """
@@ -725,3 +843,72 @@ class ProductFilteringTestCase(APITestCase):
         # First result should be cheaper one (ordering=price)
         self.assertEqual(response.data['results'][0]['name'], 'Laptop Business')
 
+
+
+class ORJSONRendererTest(TestCase):
+    """
+    Test the orjson-backed renderer (myshop/renderers.py).
+    It must handle every payload shape DRF produces — including the
+    int-keyed dicts of many=True validation errors.
+    """
+
+    def test_renders_many_validation_error_payload(self):
+        """
+        many=True serializers report errors as {index: {field: [...]}} —
+        dict keys are INTEGERS. The renderer must encode that (orjson
+        needs OPT_NON_STR_KEYS), or every batch-validation 400 would
+        crash into a 500 while rendering.
+        """
+        from myshop.renderers import ORJSONRenderer
+
+        error_payload = {0: {'image': ['No file was submitted.']}}
+        body = ORJSONRenderer().render(error_payload)
+
+        # Round-trip to check it's real JSON with the key stringified
+        self.assertEqual(
+            json.loads(body),
+            {'0': {'image': ['No file was submitted.']}},
+        )
+
+    def test_renders_decimal_like_drf(self):
+        """Decimal encodes as a JSON number (float), matching DRF's JSONEncoder."""
+        from myshop.renderers import ORJSONRenderer
+
+        body = ORJSONRenderer().render({'average_price': Decimal('1500.00')})
+
+        self.assertEqual(json.loads(body), {'average_price': 1500.0})
+
+
+@unittest.skipIf(validators.bleach is None, 'bleach is not installed')
+class BleachValidatorTest(TestCase):
+    """
+    Test the bleach branch of validate_no_scripts (products/validators.py).
+    These only run when bleach is installed — on a bare install the
+    validator falls back to the regex scan, which the filtering tests
+    already cover.
+    """
+
+    def test_strips_and_rejects_markup(self):
+        """Tags the regex patterns don't list (e.g. <b>) are still caught."""
+        with self.assertRaises(ValidationError):
+            validators.validate_no_scripts('hello <b>world</b>')
+
+    def test_rejects_script_with_angle_bracket_body(self):
+        """The obfuscation the old [^<]* pattern missed must still fail."""
+        with self.assertRaises(ValidationError):
+            validators.validate_no_scripts('<script>if(a<b){steal()}</script>')
+
+    def test_accepts_literal_entities(self):
+        """
+        bleach returns 'AT&amp;T' UNCHANGED, but html.unescape turns it
+        into 'AT&T' — comparing only the cleaned side unescaped rejected
+        every input containing a literal entity. Both sides must be
+        unescaped before comparing.
+        """
+        for value in ('AT&amp;T', 'Tom &amp; Jerry', 'a &lt;tag&gt; mention'):
+            self.assertEqual(validators.validate_no_scripts(value), value)
+
+    def test_accepts_plain_punctuation(self):
+        """Benign text with <, & or : passes straight through."""
+        for value in ('Tom & Jerry: The Movie', 'price < 100', '5 > 3'):
+            self.assertEqual(validators.validate_no_scripts(value), value)
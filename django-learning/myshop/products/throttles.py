@@ -1,5 +1,12 @@
+from django.core.cache import caches
 from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
 
+# DRF throttles hit the cache TWICE per request (get history, set
+# history). Pointing them at the dedicated in-process 'throttle'
+# LocMem cache (see CACHES in settings) keeps those round-trips
+# in-memory even if the 'default' cache later moves to Redis/Memcached.
+THROTTLE_CACHE = caches['throttle']
+
 
 class BurstRateThrottle(UserRateThrottle):
     """
@@ -7,6 +14,7 @@ class BurstRateThrottle(UserRateThrottle):
     Allows only 3 requests per minute regardless of user type.
     """
     scope = 'burst'
+    cache = THROTTLE_CACHE
 
 
 class StrictAnonRateThrottle(AnonRateThrottle):
@@ -15,4 +23,4 @@ class StrictAnonRateThrottle(AnonRateThrottle):
     Useful for login, signup, password reset to prevent brute force attacks.
     """
     scope = 'strict_anon'
-
+    cache = THROTTLE_CACHE
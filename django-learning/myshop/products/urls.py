@@ -8,12 +8,17 @@ from .viewsets import ProductViewSet
 router = DefaultRouter()
 router.register(r'', ProductViewSet, basename='product')
 
+# router.urls is a property that REBUILDS the whole pattern list on every
+# access (DRF schema generation and reverse() in tests both poke it).
+# Materialise it once at import time so repeat accesses reuse this list.
+_router_urls = router.urls
+
 urlpatterns = [
     # Old function-based views (keeping for comparison)
     # path('', views.get_product, name='products_list'),
     # path('<int:pk>/', views.product_detail, name='product_detail'),
     # path('add/', views.product_add, name='product_add')
-    
+
     # New ViewSet with Router (uncomment to use)
-    path('', include(router.urls)),
+    path('', include(_router_urls)),
 ]
\ No newline at end of file
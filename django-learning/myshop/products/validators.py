@@ -1,7 +1,56 @@
 from django.core.exceptions import ValidationError
-import os
+import html
 import re
 
+# Upload validation constants, hoisted so validate_image_file (which
+# runs for every uploaded file) does O(1) frozenset membership checks
+# instead of rebuilding and scanning lists per call.
+# str.endswith accepts a tuple and runs as one C-level scan — no
+# splitting, no per-call string slicing (see validate_image_file)
+_ALLOWED_SUFFIXES = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+_ALLOWED_CT = frozenset({'image/jpeg', 'image/png', 'image/gif', 'image/webp'})
+_MAX_BYTES = 5 * 1024 * 1024  # 5MB
+
+# Dangerous XSS patterns merged into ONE alternation, compiled once at
+# import. validate_no_scripts used to loop over six raw strings calling
+# re.search on each — six Python→C dispatches plus a trip through re's
+# internal pattern cache per call. One precompiled pattern = one scan.
+# The script tag is matched by its bare '<script' prefix, same as the
+# iframe/embed/object alternatives: prefix matching is trivially linear
+# AND strictly stronger than requiring a closing tag (a body pattern
+# like [^<]* misses scripts containing '<', e.g. 'if(a<b)').
+_DANGEROUS_PATTERN = '|'.join([
+    r'<script',                      # script tags (prefix, like the tags below)
+    r'javascript:',                  # JavaScript protocol
+    r'on\w+\s*=',                    # Event handlers (onclick, onerror, etc.)
+    r'<iframe',                      # iframes
+    r'<embed',                       # embed tags
+    r'<object',                      # object tags
+])
+
+# Prefer google-re2 when it's installed: RE2 compiles the alternation to
+# a DFA and scans in guaranteed linear time (no backtracking at all, so
+# ReDoS is impossible by construction, and multi-pattern scans are
+# typically several times faster than CPython's engine). It's a C++
+# extension that isn't always available, so fall back transparently to
+# the stdlib-compiled pattern — both objects expose .search().
+try:
+    import re2
+
+    _DANGEROUS_RE = re2.compile(_DANGEROUS_PATTERN, re2.IGNORECASE)
+except ImportError:
+    _DANGEROUS_RE = re.compile(_DANGEROUS_PATTERN, re.IGNORECASE)
+
+# Better still than pattern-matching HTML with regexes: PARSE it.
+# bleach tokenizes with html5lib's state machine — linear time, and it
+# catches obfuscations the patterns can't (attributes split across
+# lines, '<SCRIPT\n>', entity tricks). Optional dependency, so the
+# regex scan above stays as the fallback.
+try:
+    import bleach
+except ImportError:
+    bleach = None
+
 
 def validate_image_file(file):
     """
@@ -13,29 +62,23 @@ def validate_image_file(file):
     Raises:
         ValidationError: If file is invalid
     """
-    # Define maximum file size (5MB = 5 * 1024 * 1024 bytes)
-    max_size_mb = 5
-    max_size_bytes = max_size_mb * 1024 * 1024
-    
-    # Validate file size
-    if file.size > max_size_bytes:
+    # Validate file size (limit hoisted to module level — see _MAX_BYTES)
+    if file.size > _MAX_BYTES:
         raise ValidationError(
-            f'File size must be less than {max_size_mb}MB. Your file is {file.size / (1024 * 1024):.2f}MB.'
+            f'File size must be less than 5MB. Your file is {file.size / (1024 * 1024):.2f}MB.'
         )
-    
-    # Validate file extension
-    allowed_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-    ext = os.path.splitext(file.name)[1].lower()
-    
-    if ext not in allowed_extensions:
+
+    # Validate file extension: one lowered copy of the name, one
+    # endswith() over the suffix tuple — no splitting or slicing at all.
+    name = file.name.lower()
+
+    if not name.endswith(_ALLOWED_SUFFIXES):
         raise ValidationError(
-            f'File extension "{ext}" is not allowed. Allowed extensions: {", ".join(allowed_extensions)}'
+            f'File "{file.name}" has a disallowed extension. Allowed extensions: {", ".join(_ALLOWED_SUFFIXES)}'
         )
-    
+
     # Validate content type (MIME type)
-    allowed_content_types = ['image/jpeg', 'image/png', 'image/gif', 'image/webp']
-    
-    if hasattr(file, 'content_type') and file.content_type not in allowed_content_types:
+    if hasattr(file, 'content_type') and file.content_type not in _ALLOWED_CT:
         raise ValidationError(
             f'File type "{file.content_type}" is not allowed. Must be a valid image file.'
         )
@@ -59,22 +102,40 @@ def validate_no_scripts(value):
         - <img src=x onerror="alert('xss')">
         - javascript:alert('xss')
     """
-    # List of dangerous patterns that could be used for XSS attacks
-    dangerous_patterns = [
-        r'<script[^>]*>.*?</script>',  # Script tags
-        r'javascript:',                 # JavaScript protocol
-        r'on\w+\s*=',                  # Event handlers (onclick, onerror, etc.)
-        r'<iframe',                     # iframes
-        r'<embed',                      # embed tags
-        r'<object',                     # object tags
-    ]
-    
-    # Check each pattern
-    for pattern in dangerous_patterns:
-        if re.search(pattern, value, re.IGNORECASE):
+    # FAST PATH: every dangerous pattern needs at least one of these
+    # three characters — tags need '<', javascript: needs ':', event
+    # handlers (on...=) need '='. Three C-level substring scans reject
+    # the overwhelmingly common clean-text case in nanoseconds, before
+    # any parser or regex engine spins up. ('in' on str is an optimized
+    # two-way search, far cheaper than entering the regex machinery.)
+    # The '<jJoO' character-class prefilter suggested upstream was
+    # rejected: 'o' appears in virtually all English text, so it would
+    # almost never short-circuit.
+    if '<' not in value and ':' not in value and '=' not in value:
+        return value
+
+    if bleach is not None:
+        # Strip all tags/attributes with a real HTML parser. bleach
+        # entity-escapes plain text too ('&' → '&amp;', '<' → '&lt;'),
+        # so compare BOTH sides unescaped — unescaping only the cleaned
+        # side would still reject inputs that already contain a literal
+        # entity ('AT&amp;T' comes back from clean() unchanged, but
+        # unescapes to 'AT&T' != value). Only actually-stripped markup
+        # survives the round-trip as a difference.
+        cleaned = bleach.clean(value, tags=[], attributes={}, strip=True)
+        if html.unescape(cleaned) != html.unescape(value):
             raise ValidationError(
                 'Input contains potentially dangerous content. Please remove any HTML/JavaScript code.'
             )
-    
+    # ONE compiled scan instead of six: _DANGEROUS_RE (module top) joins
+    # all the patterns with '|', so the whole check is a single C-level
+    # regex pass with no per-call compilation or pattern loop.
+    # (Still runs after bleach: the parser can't see 'javascript:' URLs
+    # or bare event-handler text, which aren't markup.)
+    if _DANGEROUS_RE.search(value):
+        raise ValidationError(
+            'Input contains potentially dangerous content. Please remove any HTML/JavaScript code.'
+        )
+
     return value
 
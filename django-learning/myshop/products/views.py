@@ -1,8 +1,13 @@
 from functools import partial
 from itertools import product
 from django.contrib.auth import PermissionDenied
-from django.shortcuts import render
+from django.shortcuts import render, get_object_or_404
 from django.http import JsonResponse
+from django.db.models import Q
+from django.core.cache import cache
+from django.utils.dateparse import parse_datetime
+from django.db import connection
+import hashlib
 # from requests import delete
 from .models import Product
 from rest_framework.decorators import api_view
@@ -36,6 +41,30 @@ from rest_framework.exceptions import PermissionDenied
 #     return JsonResponse({'products': product_data})
 
 
+def approx_count(model):
+    """
+    Fast, approximate row count for an unfiltered table.
+
+    SELECT COUNT(*) walks every (visible) row — O(table) on every
+    request just to render a 'count' field. Postgres keeps a statistics
+    estimate in pg_class.reltuples, maintained by autovacuum; reading it
+    is O(1) and plenty accurate for pagination UI. On other backends
+    (our dev SQLite) fall back to an exact count memoized for 30s.
+    """
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [model._meta.db_table],
+            )
+            estimate = cursor.fetchone()[0]
+        # A never-analyzed table reports -1 (or 0 while empty-ish);
+        # only trust real estimates
+        if estimate >= 0:
+            return estimate
+    return cache.get_or_set('product_count', model.objects.count, 30)
+
+
 @api_view(['GET'])
 def get_product(request):
 
@@ -44,40 +73,128 @@ def get_product(request):
     min_price = request.GET.get('min_price')
     max_price = request.GET.get('max_price')
     product_search = request.GET.get('search')
-    
+
+    # Build ONE lazy queryset and keep chaining onto it. The old code
+    # reassigned `products = Product.objects.filter(...)` in each branch
+    # (each filter threw away the previous one), then sliced an
+    # unfiltered .all() anyway — so the filters never reached SQL and
+    # Python paged through unfiltered rows. Chained filters compose into
+    # a single WHERE clause the database evaluates.
+    qs = Product.objects.all()
+
     if min_price:
-        products = Product.objects.filter(price__lte=min_price)
+        # min_price is a floor → price__gte (the old branch had gte/lte
+        # swapped, returning everything CHEAPER than the minimum!)
+        qs = qs.filter(price__gte=min_price)
 
     if max_price:
-        products = Product.objects.filter(price__gte=max_price)
+        qs = qs.filter(price__lte=max_price)
 
     if product_search:
-        products = Product.objects.filter(category__iexact=product_search)
-
-    # Let's add filter 
-
+        # Product has no category field — search matches the name
+        qs = qs.filter(name__icontains=product_search)
 
     # Getting pagination parameters from URL
     page = int(request.GET.get('page', 1))
     page_size = int(request.GET.get('page_size', 4)) #20 is default
 
-    # Calculation item start and end number
-    start = (page -1) * page_size
-    end = start + page_size
-
-    # products = Product.objects.all()  #django model data
-    products = Product.objects.all()[start : end]  #django model data
-    total = Product.objects.count()
-
+    # --- Keyset ("cursor") pagination -----------------------------------
+    # OFFSET paging makes the DB read and THROW AWAY page*page_size rows
+    # before returning anything — page 1000 costs 1000x page 1. With a
+    # keyset cursor the client sends the (created_at, id) of the last row
+    # it saw and we seek straight to it via the ordering index:
+    #   GET ?after=<iso_created_at>&after_id=<id>
+    # Deep pages then cost the same as page 1. ties on created_at are
+    # broken by id so the cursor is total-ordered and rows never repeat.
+    after = request.GET.get('after')
+    after_id = request.GET.get('after_id')
+    cursor = None
+    if after and after_id:
+        # Parse BOTH halves before touching the ORM — a garbage cursor
+        # (?after=junk&after_id=abc) must degrade to offset paging, not
+        # blow up in int() or the date lookup with a 500.
+        after_dt = parse_datetime(after)
+        try:
+            after_pk = int(after_id)
+        except ValueError:
+            after_pk = None
+        if after_dt is not None and after_pk is not None:
+            cursor = (after_dt, after_pk)
+            qs = qs.filter(
+                Q(created_at__lt=after_dt)
+                | Q(created_at=after_dt, id__lt=after_pk)
+            )
+
+    # values() instead of full model instances: the ORM skips
+    # Model.__init__ / descriptor setup per row and hands us plain dicts.
+    # For a read-only list that's all we need — no serializer class, no
+    # per-object construction, just the columns the payload renders.
+    # Fetch page_size+1 rows: the extra row just tells us whether a next
+    # page exists, without a COUNT query.
+    # .iterator() streams rows instead of building the queryset's
+    # _result_cache first (on Postgres it's a server-side cursor) — we
+    # consume the page exactly once, so the cache is pure overhead.
+    rows = list(qs.order_by('-created_at', '-id').values(
+        'id', 'name', 'description', 'price', 'stock', 'sku', 'created_at',
+    )[: page_size + 1].iterator(chunk_size=page_size + 1)) if cursor else None
+
+    if rows is None:
+        # --- Legacy offset path (no cursor supplied) --------------------
+        start = (page -1) * page_size
+        end = start + page_size
+
+        # COUNT(*) scans the whole (filtered) table on every request.
+        # Unfiltered: use the planner's O(1) estimate (see approx_count).
+        # Filtered: the count is exact but memoized per filter signature,
+        # so bursts of identical filter requests share one scan.
+        if min_price or max_price or product_search:
+            filter_sig = hashlib.blake2b(
+                f'{min_price}|{max_price}|{product_search}'.encode(),
+                digest_size=8,
+            ).hexdigest()
+            total = cache.get_or_set(f'pcount:{filter_sig}', qs.count, 30)
+        else:
+            total = approx_count(Product)
+
+        # Stream the page rows too (single pass — see iterator note above)
+        rows = qs.order_by('-created_at', '-id').values(
+            'id', 'name', 'description', 'price', 'stock', 'sku', 'created_at',
+        )[start : end].iterator(chunk_size=page_size)
+        has_next = end < total
+        next_link = f'?page={page+1}' if has_next else None
+        prev_link = f'?page={page-1}' if page > 1 else None
+    else:
+        total = None  # cursor clients use /products/statistics/ for totals
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        if has_next:
+            last = rows[-1]
+            next_link = f"?after={last['created_at'].isoformat()}&after_id={last['id']}"
+        else:
+            next_link = None
+        prev_link = None  # keyset cursors only move forward
+
+    # Manual dict assembly (same shape the old serializer produced)
+    product_data = [
+        {
+            'id': row['id'],
+            'name': row['name'],
+            'description': row['description'],
+            'price': str(row['price']),
+            'stock': row['stock'],
+            'sku': row['sku'],
+            'created_at': row['created_at'].isoformat(),
+        }
+        for row in rows
+    ]
 
-    serializer = ProductSerializer(products, many=True) #converts django object into JSON
     return Response({
         "status" : "success",
         "message" : "Products fetched successfully",
-        "data" : serializer.data,
+        "data" : product_data,
         "count" : total,
-        "previous" : f'?page={page-1}' if page>1 else None,
-        "next" : f'?page={page+1}' if end < total else None,
+        "previous" : prev_link,
+        "next" : next_link,
     }, status.HTTP_200_OK)
 
 
@@ -106,15 +223,24 @@ def product_add(request):
 
 # UPdating and Deleting Product
 @api_view([ 'PUT', 'PATCH', 'DELETE'])
-@permission_classes([IsOwnerOrReadOnly])  # Keep this because it's MORE SPECIFIC than the global default
-# This overrides the global permission to add ownership check
+# IsAuthenticated must be listed too: @permission_classes REPLACES the
+# global default, and IsOwnerOrReadOnly has no has_permission — without
+# it an anonymous request reaches the created_by=request.user lookup
+# below and crashes (AnonymousUser isn't a valid FK value). Same trap
+# the ProductViewSet permission fix closed.
+@permission_classes([IsAuthenticated, IsOwnerOrReadOnly])
 def product_detail(request, pk):
-    # Updating whole Product
-    product = Product.objects.get(pk=pk)
-
-    permission = IsOwnerOrReadOnly()
-    if not permission.has_object_permission(request, None, product):
-        raise PermissionDenied("You dont have permission to modify this product")
+    # Every method here mutates, so push the ownership check INTO the
+    # lookup: created_by is an indexed FK column, and one WHERE clause
+    # replaces fetch-then-check-in-Python. get_object_or_404 also turns
+    # a missing pk into a clean 404 instead of an unhandled DoesNotExist
+    # (which used to surface as a 500). select_related joins the owner
+    # row in the same query for the serialized response.
+    product = get_object_or_404(
+        Product.objects.select_related('created_by'),
+        pk=pk,
+        created_by=request.user,
+    )
 
     if request.method == 'PUT':
         serializer = ProductSerializer(product, data = request.data, partial=False)
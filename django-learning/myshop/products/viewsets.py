@@ -3,18 +3,60 @@ from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from rest_framework.filters import OrderingFilter
+import hashlib
+
 from django.core.cache import cache
-from django.db.models import Avg, Sum, Count
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from django.db.models import Avg, Sum, Count, Prefetch
 from .models import Product, ProductImage
-from .serializers import ProductSerializer, ProductImageSerializer
+from .serializers import ProductSerializer, ProductListSerializer, ProductImageSerializer
 from .permissions import IsOwnerOrReadOnly
-from .filters import ProductFilter
+from .filters import ProductFilter, CachedSearchFilter
 from .throttles import BurstRateThrottle
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+def _products_ver():
+    """
+    Current cache GENERATION for everything product-shaped.
+
+    Every list/statistics cache key embeds this number, so bumping it
+    on a write instantly orphans EVERY cached variant (all query-string
+    hashes + statistics) in one O(1) operation — no pattern scans, no
+    per-key deletes. Orphaned entries simply age out via their TTL.
+    """
+    return cache.get_or_set('products_ver', 1, None)
+
+
+def _bump_products_ver():
+    # incr is atomic on real cache backends; ValueError means the
+    # counter isn't there yet (cold cache), so seed it instead.
+    try:
+        cache.incr('products_ver')
+    except ValueError:
+        cache.set('products_ver', 1, None)
+
+
+def _products_last_modified(request, *args, **kwargs):
+    """
+    Catalog-wide Last-Modified for conditional GETs.
+
+    The perform_* hooks stamp 'products_lm' on every write, so this is a
+    cache read — NO database query per request. Returning None (cold
+    cache) just means "can't tell", and Django serves the full response.
+    """
+    return cache.get('products_lm')
+
+
+def _products_etag(request, *args, **kwargs):
+    # Derived from the same timestamp — weak ETag, changes whenever any
+    # product changes
+    lm = cache.get('products_lm')
+    return f'W/"{lm.timestamp()}"' if lm else None
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -42,7 +84,21 @@ from drf_spectacular.utils import extend_schema, extend_schema_view
         description="Delete a product. Only the owner can delete. This action cannot be undone"
     )
 )
-@method_decorator(cache_page(60), name='list')  # Cache the list view for 60 seconds
+# Conditional-GET support: if the client sends If-Modified-Since /
+# If-None-Match and the catalog hasn't changed since, Django answers
+# 304 with NO body — no queryset, no serializer, no JSON, no egress.
+# The cheapest response is the one you never render! retrieve reuses
+# the catalog-wide stamp: coarser than per-object updated_at, but it
+# costs zero queries and is always safe (a change anywhere just forces
+# a full response).
+@method_decorator(
+    condition(etag_func=_products_etag, last_modified_func=_products_last_modified),
+    name='list',
+)
+@method_decorator(
+    condition(etag_func=_products_etag, last_modified_func=_products_last_modified),
+    name='retrieve',
+)
 class ProductViewSet(viewsets.ModelViewSet):
     """
     API endpoint for managing products.
@@ -66,17 +122,70 @@ class ProductViewSet(viewsets.ModelViewSet):
     - POST/PUT/PATCH/DELETE: Requires authentication
     - Update/Delete: Only product owner can modify
     """
-    # not optimised (N+1) DB calls
-    # queryset = Product.objects.all().order_by('-created_at')
-
-    queryset = Product.objects.select_related('created_by').prefetch_related('images').all().order_by('-created_at')
     serializer_class = ProductSerializer
-    # Removed IsAuthenticatedOrReadOnly because it's now the GLOBAL default
-    # We only specify IsOwnerOrReadOnly which is MORE SPECIFIC than the default
-    permission_classes = [IsOwnerOrReadOnly]
+
+    def get_queryset(self):
+        """
+        Explicit, optimised queryset for every action.
+
+        - select_related('created_by') = SQL JOIN, so serializing the
+          nested user doesn't cost 1 query per product (the N+1 trap!)
+        - Prefetch with an .only() queryset = 1 batched query for ALL
+          images, fetching just the columns ProductImageSerializer
+          actually renders — but ONLY for the actions whose serializer
+          emits the nested gallery. ProductListSerializer dropped
+          `images`, so prefetching them for list fetched every image
+          row on the page just to throw them away.
+
+        Result: 2 queries per list page (count + products JOIN user),
+        3 for detail actions (+ images). Verify with
+        django-debug-toolbar! (Libraries like django-auto-prefetching
+        can derive this from the serializer, but being explicit keeps
+        the query plan obvious.)
+
+        # not optimised (N+1) DB calls:
+        # return Product.objects.all().order_by('-created_at')
+        """
+        qs = Product.objects.select_related('created_by').order_by('-created_at')
+
+        if self.action in ('retrieve', 'update', 'partial_update'):
+            # Only these actions serialize the nested images gallery
+            qs = qs.prefetch_related(
+                Prefetch(
+                    'images',
+                    queryset=ProductImage.objects.only(
+                        'id', 'product_id', 'image', 'is_primary', 'order', 'uploaded_at'
+                    ),
+                )
+            )
+
+        if self.action == 'list':
+            # Project the list page down to the columns
+            # ProductListSerializer actually renders (plus image/stock/
+            # price, which to_representation reads for the computed
+            # fields). Narrower rows = fewer bytes off the DB socket and
+            # fewer attribute loads per product. CAREFUL when editing:
+            # a field missing here but touched during serialization
+            # triggers a lazy per-object re-fetch (the N+1 comes back!).
+            qs = qs.only(
+                'id', 'name', 'description', 'price', 'stock', 'sku',
+                'image', 'created_at',
+                'created_by__id', 'created_by__username', 'created_by__email',
+            )
+
+        return qs
+    # BOTH permissions are needed here! Setting permission_classes
+    # REPLACES the global default entirely (it doesn't add to it), so
+    # listing only IsOwnerOrReadOnly let anonymous users POST — and the
+    # create path then crashed assigning AnonymousUser to created_by.
+    # IsAuthenticatedOrReadOnly gates writes to logged-in users,
+    # IsOwnerOrReadOnly additionally restricts update/delete to the owner.
+    permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly]
 
     # Enable filtering, searching, and ordering
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    # CachedSearchFilter = stock SearchFilter + memoised field→lookup
+    # construction (see filters.py)
+    filter_backends = [DjangoFilterBackend, CachedSearchFilter, OrderingFilter]
 
     # Use custom filter class for advanced filtering
     filterset_class = ProductFilter
@@ -88,6 +197,30 @@ class ProductViewSet(viewsets.ModelViewSet):
     # Specify which fields can be used for ordering/sorting
     ordering_fields = ['price', 'stock', 'created_at']
 
+    def get_serializer_context(self):
+        """
+        Compute the media host ONCE per request and hand it to the
+        serializers. Every image URL then becomes a plain string concat
+        instead of a request.build_absolute_uri() urlparse — which used
+        to run once per image, per product, per page.
+        """
+        ctx = super().get_serializer_context()
+        request = ctx.get('request')
+        if request is not None:
+            ctx['_media_host'] = request.build_absolute_uri('/')[:-1]
+        return ctx
+
+    def get_serializer_class(self):
+        """
+        Use the slim ProductListSerializer for the list action and the
+        full ProductSerializer everywhere else (retrieve/create/update).
+        The list page doesn't render the nested images gallery, so there's
+        no point serializing it for every row.
+        """
+        if self.action == 'list':
+            return ProductListSerializer
+        return super().get_serializer_class()
+
     def get_throttles(self):
         """
         Override throttles based on the action.
@@ -103,94 +236,106 @@ class ProductViewSet(viewsets.ModelViewSet):
     def list(self, request, *args, **kwargs):
         """
         Override the list method to add MANUAL caching.
-        This demonstrates how manual caching works for product list.
+
+        ONE cache layer, keyed by the query string. The previous setup
+        stacked cache_page (keyed by full URL) ON TOP of a manual
+        cache.get('product_list') that ignored query params entirely —
+        so ?page=2 or ?search=... requests could be answered with a
+        cached page 1, and the two layers invalidated on different
+        schedules. Now every distinct query string gets its own entry
+        (hashed with blake2b so keys stay short and memcached-safe),
+        and the perform_* hooks below invalidate all of them together.
+
+        What gets cached: the RENDERED JSON BYTES, not response.data.
+        Caching the Python dict meant every hit still paid the DRF
+        renderer (dict → JSON) and an expensive pickle/unpickle of
+        nested OrderedDicts on the way in and out of the cache. With
+        bytes, a hit is one cache.get + HttpResponse(body) — no
+        serializer, no renderer, nothing to pickle.
+
+        Freshness metadata moved from the body to an X-Cache header
+        (HIT/MISS), so the cached bytes are exactly what a fresh render
+        produces.
 
         THE FLOW:
 
-        FIRST REQUEST: GET /products/
-        1. cache.get('product_list') → Returns None (empty)
-        2. Query database: Product.objects.all() → [P1, P2, P3]
-        3. cache.set('product_list', [P1, P2, P3]) → Store in cache
-        4. Return [P1, P2, P3] to user
-
-        SECOND REQUEST: GET /products/ (within 5 min)
-        1. cache.get('product_list') → Returns [P1, P2, P3] (found!)
-        2. Return cached list immediately (NO database query!)
-
-        WHEN NEW PRODUCT CREATED:
-        1. perform_create() runs → cache.delete('product_list')
-        2. Cache is now empty
-
-        NEXT REQUEST AFTER CREATION: GET /products/
-        1. cache.get('product_list') → Returns None (was deleted!)
-        2. Query database: Product.objects.all() → [P1, P2, P3, P4] (NEW!)
-        3. cache.set('product_list', [P1, P2, P3, P4]) → Store fresh data
-        4. Return [P1, P2, P3, P4] to user ✅ UPDATED!
+        FIRST REQUEST: GET /products/?page=2
+        1. cache.get('product_list:<hash of "page=2">') → None
+        2. Run the normal list (DB + serializer + renderer)
+        3. cache.set(...) → store the JSON bytes for 5 minutes
+        4. Return fresh data (X-Cache: MISS)
+
+        SECOND REQUEST: same URL within 5 min → cache hit, the stored
+        bytes go straight out (X-Cache: HIT). A request with a DIFFERENT
+        query string hashes to a different key, so pages/filters never
+        collide.
         """
 
-        # STEP 1: Define cache key
-        cache_key = 'product_list'
+        # STEP 1: Cache key = generation counter + stable hash of the
+        # query string (bumping the counter invalidates every variant)
+        qs_hash = hashlib.blake2b(
+            request.META.get('QUERY_STRING', '').encode(), digest_size=8
+        ).hexdigest()
+        cache_key = f'product_list:{_products_ver()}:{qs_hash}'
 
         # STEP 2: Try to get from cache first
-        cached_products = cache.get(cache_key)
+        cached_body = cache.get(cache_key)
 
-        # STEP 3: If found in cache, return it (FAST!)
-        if cached_products is not None:
+        # STEP 3: If found in cache, return the bytes as-is (FAST!)
+        if cached_body is not None:
             print("✅ CACHE HIT! Returning cached product list")
-            # Return the cached response
-            return Response({
-                'cached': True,
-                'message': 'This list came from cache! ⚡',
-                'results': cached_products
-            })
+            response = HttpResponse(cached_body, content_type='application/json')
+            response['X-Cache'] = 'HIT'
+            return response
 
         # STEP 4: Cache MISS - Get from database (SLOW)
         print("❌ CACHE MISS! Querying database for products")
         response = super().list(request, *args, **kwargs)
 
-        # STEP 5: Store the response data in cache for 5 minutes
-        cache.set(cache_key, response.data, timeout=300)
+        # STEP 5: Render once, store the bytes for 5 minutes.
+        # Use the CONFIGURED json renderer (first in renderer_classes =
+        # ORJSONRenderer from settings), not a hardcoded one — otherwise
+        # hits and misses for the same URL are encoded by different
+        # renderers and value types flip between cache states.
+        cache.set(cache_key, self.renderer_classes[0]().render(response.data), timeout=300)
         print("💾 Saved to cache for 5 minutes")
 
-        # STEP 6: Add metadata to show it's fresh data
-        response.data['cached'] = False
-        response.data['message'] = 'Fresh from database! 🐌'
-
+        response['X-Cache'] = 'MISS'
         return response
 
     def perform_create(self, serializer):
         """
         Called when creating a new product.
-        DELETE the cached product list so next request gets fresh data!
+        Bump the cache generation so the next request gets fresh data!
         """
         super().perform_create(serializer)
 
-        # Delete the cached product list
-        cache.delete('product_list')
-        print("🗑️ Deleted cached product list (so next request gets fresh data)")
-
-        # Also delete statistics cache
+        # ONE counter bump orphans every cached list variant AND the
+        # statistics entry — no per-key deletes to keep in sync
+        _bump_products_ver()
+        print("🗑️ Bumped products cache generation (so next request gets fresh data)")
 
-        cache.delete('product_statistics')
+        # New catalog timestamp → conditional GETs stop matching
+        cache.set('products_lm', timezone.now(), None)
 
     def perform_update(self, serializer):
         """
         Called when updating a product.
-        DELETE the cached product list (price/name might have changed!)
+        Bump the cache generation (price/name might have changed!)
         """
         super().perform_update(serializer)
-        cache.delete('product_list')
-        cache.delete('product_statistics')
+        _bump_products_ver()
+        cache.set('products_lm', timezone.now(), None)
         print("🗑️ Deleted cached product list (product was updated)")
 
     def perform_destroy(self, instance):
         """
         Called when deleting a product.
-        DELETE the cached product list (product no longer exists!)
+        Bump the cache generation (product no longer exists!)
         """
         super().perform_destroy(instance)
-        cache.delete('product_list')
-        cache.delete('product_statistics')
+        _bump_products_ver()
+        cache.set('products_lm', timezone.now(), None)
         print("🗑️ Deleted cached product list (product was deleted)")
 
 
@@ -210,6 +355,13 @@ class ProductViewSet(viewsets.ModelViewSet):
     },
     tags=['Statistics'])
     @action(detail=False, methods=['get'])
+    # Same conditional-GET treatment as list/retrieve: repeat pollers
+    # that already hold the current stats get an empty 304 — no
+    # aggregate, no renderer, no body. The Last-Modified/ETag funcs read
+    # the cached 'products_lm' stamp, so the check costs zero queries.
+    @method_decorator(
+        condition(etag_func=_products_etag, last_modified_func=_products_last_modified)
+    )
     def statistics(self, request):
         """
         Custom endpoint: GET /products/statistics/
@@ -239,30 +391,38 @@ class ProductViewSet(viewsets.ModelViewSet):
         This is how we keep cache up-to-date!
         """
 
-        # STEP 1: Try to get from cache (like checking if you have leftovers in fridge)
-        cache_key = 'product_statistics'
-        cached_stats = cache.get(cache_key)
+        # STEP 1: Try to get from cache (like checking if you have leftovers in fridge).
+        # As with list(), we cache the rendered JSON BYTES so a hit
+        # skips the renderer and pickle entirely; X-Cache says which
+        # path served the response.
+        cache_key = f'product_statistics:{_products_ver()}'
+        cached_body = cache.get(cache_key)
 
         # STEP 2: If found in cache, return it immediately (fast!)
-        if cached_stats is not None:
-            cached_stats['cached'] = True
-            cached_stats['message'] = 'From cache! ⚡'
-            return Response(cached_stats)
-
-        # STEP 3: Not in cache, so calculate it (slow, but necessary)
-        stats = {
-            'total_products': Product.objects.count(),
-            'average_price': Product.objects.aggregate(Avg('price'))['price__avg'],
-            'total_stock': Product.objects.aggregate(Sum('stock'))['stock__sum'],
-            'cached': False,
-            'message': 'Calculated fresh! 🐌'
-        }
-
-        # STEP 4: Save to cache for next time (expires in 5 minutes)
-        cache.set(cache_key, stats, timeout=300)
+        if cached_body is not None:
+            response = HttpResponse(cached_body, content_type='application/json')
+            response['X-Cache'] = 'HIT'
+            return response
+
+        # STEP 3: Not in cache, so calculate it (slow, but necessary).
+        # ONE aggregate() call computes all three numbers in a single
+        # SQL statement — the old version ran count() + two separate
+        # aggregate() queries, i.e. three table scans instead of one.
+        stats = Product.objects.aggregate(
+            total_products=Count('id'),
+            average_price=Avg('price'),
+            total_stock=Sum('stock'),
+        )
+
+        # STEP 4: Save the rendered bytes for next time (expires in 5
+        # minutes) — same configured renderer as the fresh response, so
+        # HIT and MISS bodies are byte-identical (see list())
+        cache.set(cache_key, self.renderer_classes[0]().render(stats), timeout=300)
 
         # STEP 5: Return the stats
-        return Response(stats)
+        response = Response(stats)
+        response['X-Cache'] = 'MISS'
+        return response
 
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticatedOrReadOnly])
     def upload_image(self, request, pk=None):
@@ -277,11 +437,46 @@ class ProductViewSet(viewsets.ModelViewSet):
         """
         product = self.get_object()
 
-        # Create ProductImage instance
+        # BATCH path: a gallery upload posts SEVERAL files under the
+        # repeated multipart field 'images'. They MUST be read with
+        # request.FILES.getlist() — QueryDict.get() only ever returns
+        # the last value, so a dict lookup can never see the full list.
+        # Validating with many=True and inserting with bulk_create turns
+        # N INSERT round-trips into ceil(N/100) — for galleries the
+        # per-statement network RTT dominates, not the validation.
+        gallery_files = request.FILES.getlist('images')
+        if gallery_files:
+            serializer = ProductImageSerializer(
+                data=[{'image': f} for f in gallery_files],
+                many=True,
+                context={'request': request},
+            )
+            serializer.is_valid(raise_exception=True)
+            created = ProductImage.objects.bulk_create(
+                [ProductImage(product=product, **item) for item in serializer.validated_data],
+                batch_size=100,
+            )
+            # Image uploads are writes too! Without these, a client
+            # re-polling the product detail with If-Modified-Since keeps
+            # getting 304 and never sees the new gallery (retrieve's
+            # condition() reads the 'products_lm' stamp).
+            _bump_products_ver()
+            cache.set('products_lm', timezone.now(), None)
+            return Response({
+                'message': f'{len(created)} images uploaded successfully',
+                'images': ProductImageSerializer(
+                    created, many=True, context={'request': request}
+                ).data,
+            }, status=201)
+
+        # SINGLE-file path (unchanged): one image per request
         serializer = ProductImageSerializer(data=request.data, context={'request': request})
 
         if serializer.is_valid():
             serializer.save(product=product)
+            # Same invalidation as the batch path above
+            _bump_products_ver()
+            cache.set('products_lm', timezone.now(), None)
             return Response({
                 'message': 'Image uploaded successfully',
                 'image': serializer.data